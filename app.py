@@ -1,35 +1,194 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, stream_with_context
+from flask_caching import Cache
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.orm import raiseload, selectinload
+import hashlib
+import io
+import msgspec
+import orjson
 import os
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Union
 from dotenv import load_dotenv
 
 app = Flask(__name__)
 
-# Load environment variables from .env file
-load_dotenv()
 
-# Configure the database connection URL.
+# Serialize responses with orjson (C encoder) instead of flask.jsonify's
+# stdlib json path; the bytes go straight into the response body with no
+# intermediate str.
+def ojson(obj, status=200):
+    # default=str renders Decimal prices as fixed-point strings like
+    # "129.99" instead of failing or emitting float noise.
+    return app.response_class(orjson.dumps(obj, default=str), status=status,
+                              mimetype='application/json')
+
+# All environment configuration, read once at import; a missing required
+# variable fails the boot instead of surfacing at the first query.
+@dataclass(frozen=True)
+class Config:
+    mysql_user: str
+    mysql_password: str
+    mysql_host: str
+    mysql_db: str
+    redis_url: str
+    flask_env: str
+    init_db: bool
+
+    @classmethod
+    def from_env(cls):
+        # Load environment variables from .env file
+        load_dotenv()
+        required = ('MYSQL_DATABASE_USER', 'MYSQL_DATABASE_PASSWORD',
+                    'MYSQL_DATABASE_HOST', 'MYSQL_DATABASE_DB')
+        missing = [name for name in required if os.getenv(name) is None]
+        if missing:
+            raise RuntimeError(
+                f"Missing required environment variables: {', '.join(missing)}")
+        return cls(
+            mysql_user=os.getenv('MYSQL_DATABASE_USER'),
+            mysql_password=os.getenv('MYSQL_DATABASE_PASSWORD'),
+            mysql_host=os.getenv('MYSQL_DATABASE_HOST'),
+            mysql_db=os.getenv('MYSQL_DATABASE_DB'),
+            redis_url=os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+            flask_env=os.getenv('FLASK_ENV', 'production'),
+            init_db=os.getenv('FLASK_INIT_DB') == '1',
+        )
+
+
+config = Config.from_env()
+
+# Configure the database connection URL. Pin the mysqlclient (C) driver
+# explicitly; the bare mysql:// scheme uses whichever DBAPI happens to be
+# installed, and the pure-Python PyMySQL decodes result rows far slower.
 app.config['SQLALCHEMY_DATABASE_URI'] = (
-    f"mysql://{os.getenv('MYSQL_DATABASE_USER')}:{os.getenv('MYSQL_DATABASE_PASSWORD')}@{os.getenv('MYSQL_DATABASE_HOST')}/{os.getenv('MYSQL_DATABASE_DB')}"
+    f"mysql+mysqldb://{config.mysql_user}:{config.mysql_password}@{config.mysql_host}/{config.mysql_db}"
 )
 
+# Configure the engine connection pool so concurrent workers reuse MySQL
+# connections instead of reconnecting per request. pool_pre_ping checks out
+# only live connections and pool_recycle stays below MySQL's wait_timeout,
+# avoiding "MySQL server has gone away" errors.
+#
+# Each gunicorn worker builds its own pool, and with 8 threads per worker
+# (gunicorn_conf.py) a worker can never hold more than 8 connections at
+# once — so pool_size matches the thread count with no overflow, keeping
+# the fleet total at workers * 8, under MySQL's default max_connections
+# of 151 for the 2*cpu+1 workers of a typical host.
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 8,
+    'max_overflow': 0,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800,
+    'pool_use_lifo': True,
+}
+
 # Initialize the SQLAlchemy object.
 db = SQLAlchemy(app)
 
+# Short-TTL Redis cache in front of the hot read endpoints; a hit skips
+# both the MySQL round trip and the JSON encode.
+cache = Cache(app, config={
+    'CACHE_TYPE': 'RedisCache',
+    'CACHE_REDIS_URL': config.redis_url,
+    'CACHE_DEFAULT_TIMEOUT': 30,
+})
+
+
+# Only cache plain 200 JSON responses — never 304s, the NDJSON stream or
+# content-negotiated binary formats (the cache key ignores Accept).
+def cacheable(response):
+    return (response.status_code == 200 and not response.is_streamed
+            and response.mimetype == 'application/json')
+
+
+# Bypass the cache entirely for Arrow-negotiating requests: the cache key
+# is path + query string only, so without this an Arrow client would be
+# served a previously cached JSON body for the same URL.
+def wants_arrow():
+    return request.accept_mimetypes.best == 'application/vnd.apache.arrow.stream'
+
+
+# Turn a 200 whose ETag matches If-None-Match into a 304 on the way out.
+# The views do this themselves on a cache miss, but on a hit cache.cached
+# returns the stored 200 before the view runs; this hook keeps
+# conditional polling working against cached responses too.
+@app.after_request
+def conditional_response(response):
+    return response.make_conditional(request)
+
+
 # Define the data model for Menu Items.
 # In the case of the MenuItem class, SQLAlchemy will automatically create a table named menu_item in your database.
 class MenuItem(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(255), nullable=False)
     description = db.Column(db.String(500))
-    price = db.Column(db.Float, nullable=False)
+    # Fixed-point for currency; DOUBLE both rounds money and emits
+    # 17-digit float reprs that bloat and destabilize the JSON payload.
+    price = db.Column(db.Numeric(10, 2), nullable=False)
     availability = db.Column(db.Boolean, default=True)
     sold_count = db.Column(db.Integer, default=0)
-
-
-# Create the database if it doesn't exist.
-with app.app_context():
-    db.create_all()
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow,
+                           onupdate=datetime.utcnow)
+
+
+# Request schema for menu item payloads. msgspec decodes and type-checks
+# the JSON body in one C pass, replacing get_json() plus manual dict
+# indexing and turning bad input into a clean 400 instead of a KeyError.
+class MenuItemIn(msgspec.Struct):
+    name: str
+    price: Decimal
+    description: str = ''
+    availability: bool = True
+    sold_count: int = 0
+
+
+# Update payloads require every field: a PUT replaces the whole item, so
+# an omitted field is a client error, not a default to silently apply.
+class MenuItemUpdate(msgspec.Struct):
+    name: str
+    price: Decimal
+    description: str
+    availability: bool
+    sold_count: int
+
+
+# Build the menu page statement as a lambda statement: SQLAlchemy caches
+# the compiled SQL keyed on the lambdas' identities, so each request pays
+# a cache lookup plus fresh bind values instead of a full compile.
+def menu_page_stmt(cursor, limit=None):
+    stmt = lambda_stmt(lambda: select(
+        MenuItem.id, MenuItem.name, MenuItem.description, MenuItem.price,
+        MenuItem.availability, MenuItem.sold_count).order_by(MenuItem.id))
+    stmt += lambda s: s.where(MenuItem.id > cursor)
+    if limit is not None:
+        stmt += lambda s: s.limit(limit)
+    return stmt
+
+
+# Compute a weak ETag for a whole table from a cheap aggregate query;
+# any insert, delete or update changes at least one of the three values.
+def table_etag(model):
+    row = db.session.execute(
+        db.select(db.func.max(model.id), db.func.count(),
+                  db.func.max(model.updated_at))
+    ).one()
+    return hashlib.md5(f"{row[0]}:{row[1]}:{row[2]}".encode()).hexdigest()
+
+
+# Return a bodyless 304 if the client's If-None-Match matches the ETag,
+# otherwise None so the endpoint runs the full query.
+def not_modified(etag):
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+    return None
 
 
 @app.route('/', methods=['GET'])
@@ -41,147 +200,269 @@ def hello_world():
 @app.route('/menu/add', methods=['POST'])
 def add_menu_item():
     try:
-        # Extract data from the request.
-        data = request.get_json()
-        name = data['name']
-        description = data['description']
-        price = data['price']
-        availability = data['availability']
-        sold_count = data['sold_count']
+        # Decode and validate the request body in one pass.
+        data = msgspec.json.decode(request.get_data(),
+                                   type=Union[MenuItemIn, List[MenuItemIn]])
+
+        # A JSON array of items is inserted with one multi-row INSERT via
+        # the Core bulk path instead of one unit-of-work flush per item.
+        if isinstance(data, list):
+            db.session.execute(db.insert(MenuItem),
+                               [msgspec.structs.asdict(item) for item in data])
+            db.session.commit()
+            cache.clear()
+            return ojson({'message': f'{len(data)} menu items added successfully'}, 201)
 
         # Create a new Menu Item object.
-        new_item = MenuItem(name=name, description=description,
-                            price=price, availability=availability, sold_count=sold_count)
+        new_item = MenuItem(name=data.name, description=data.description,
+                            price=data.price, availability=data.availability,
+                            sold_count=data.sold_count)
 
         # Add the new item to the database.
         db.session.add(new_item)
         db.session.commit()
 
-        return jsonify({"message": "Menu item added successfully"}), 201
+        # Drop the cached menu pages so readers see the new item.
+        cache.clear()
+
+        return ojson({"message": "Menu item added successfully"}, 201)
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        return ojson({"error": str(e)}, 400)
 
 
 @app.route('/menu', methods=['GET'])
+@cache.cached(timeout=60, query_string=True, response_filter=cacheable,
+              unless=wants_arrow)
 def get_menu_items():
     try:
-        # Retrieve and return a list of menu items from the database.
-        menu_items = MenuItem.query.all()
-
-        # Convert menu items to a list of dictionaries.
-        menu_items_list = []
-        for item in menu_items:
-            menu_item = {
-                'id': item.id,
-                'name': item.name,
-                'description': item.description,
-                'price': item.price,
-                'availability': item.availability,
-                'sold_count': item.sold_count
-            }
-
-            menu_items_list.append(menu_item)
-
-        return jsonify(menu_items_list), 200
+        # Answer with a bodyless 304 when the client already holds the
+        # current version of the menu, skipping the full query and encode.
+        etag = table_etag(MenuItem)
+        cached = not_modified(etag)
+        if cached:
+            return cached
+
+        # Keyset pagination: ?limit= caps the page size and ?cursor= is
+        # the last id of the previous page, so deep pages stay as cheap
+        # as the first one. Bad values are client errors, not 500s.
+        try:
+            limit = int(request.args.get('limit', 50))
+            cursor = int(request.args.get('cursor', 0))
+        except ValueError:
+            return ojson({'error': 'limit and cursor must be integers'}, 400)
+        if limit < 1:
+            return ojson({'error': 'limit must be a positive integer'}, 400)
+        limit = min(limit, 500)
+        cursor = max(cursor, 0)
+
+        # Select only the needed columns as plain Core rows instead of full
+        # ORM objects; the cached lambda statement skips SQL compilation.
+        stmt = menu_page_stmt(cursor)
+
+        keys = ('id', 'name', 'description', 'price', 'availability', 'sold_count')
+
+        # Analytics clients negotiating Arrow IPC get the result as a
+        # typed columnar stream: no per-row key repetition, numbers stay
+        # binary, and DataFrame libraries read it zero-copy. pyarrow is
+        # imported lazily so the JSON paths don't pay for it.
+        if wants_arrow():
+            import pyarrow as pa
+
+            rows = db.session.execute(stmt).all()
+            table = pa.Table.from_pydict(
+                {key: [row[i] for row in rows] for i, key in enumerate(keys)})
+            buf = io.BytesIO()
+            with pa.ipc.new_stream(buf, table.schema) as writer:
+                writer.write_table(table)
+            return app.response_class(
+                buf.getvalue(), mimetype='application/vnd.apache.arrow.stream')
+
+        # ?format=ndjson streams the whole result one JSON line at a
+        # time with at most 500 rows buffered server-side, for clients
+        # pulling very large menus.
+        if request.args.get('format') == 'ndjson':
+            result = db.session.execute(
+                stmt, execution_options={'yield_per': 500})
+
+            def generate():
+                for row in result:
+                    yield orjson.dumps(dict(zip(keys, row)), default=str) + b'\n'
+
+            return app.response_class(stream_with_context(generate()),
+                                      mimetype='application/x-ndjson')
+
+        # Convert the rows to a list of dictionaries.
+        rows = db.session.execute(menu_page_stmt(cursor, limit)).all()
+        menu_items_list = [dict(zip(keys, row)) for row in rows]
+
+        response = ojson(menu_items_list, 200)
+        response.set_etag(etag, weak=True)
+        # Point a full page at the next one so clients can keep paging.
+        if len(rows) == limit:
+            response.headers['Link'] = (
+                f'<{request.path}?limit={limit}&cursor={rows[-1][0]}>; rel="next"'
+            )
+        return response
 
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 @app.route('/menu/update/<int:item_id>', methods=['PUT'])
 def update_menu_item(item_id):
     try:
-        # Extract and validate request data.
-        data = request.get_json()
-        name = data['name']
-        description = data['description']
-        price = data['price']
-        availability = data['availability']
-        sold_count = data['sold_count']
+        # Decode and validate request data.
+        data = msgspec.json.decode(request.get_data(), type=MenuItemUpdate)
 
-        # Find the menu item by ID.
-        menu_item = MenuItem.query.get(item_id)
+        # Find the menu item by ID; Session.get is the 2.x fast path with
+        # an identity-map hit and a cached primary-key SELECT.
+        menu_item = db.session.get(MenuItem, item_id)
 
         if not menu_item:
-            return jsonify({'error': 'Menu item not found'}), 404
+            return ojson({'error': 'Menu item not found'}, 404)
 
         # Update the menu item attributes.
-        menu_item.name = name
-        menu_item.description = description
-        menu_item.price = price
-        menu_item.availability = availability
-        menu_item.sold_count = sold_count
+        menu_item.name = data.name
+        menu_item.description = data.description
+        menu_item.price = data.price
+        menu_item.availability = data.availability
+        menu_item.sold_count = data.sold_count
 
         # Commit the changes to the database.
         db.session.commit()
 
-        return jsonify({'message': 'Menu item updated successfully'}), 200
+        cache.clear()
+
+        return ojson({'message': 'Menu item updated successfully'}, 200)
 
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return ojson({'error': str(e)}, 400)
 
 
 @app.route('/menu/delete/<int:item_id>', methods=['DELETE'])
 def delete_menu_item(item_id):
     try:
-        # Find the menu item by ID.
-        menu_item = MenuItem.query.get(item_id)
+        # Delete with a single Core DELETE instead of fetching the row
+        # into the session first; rowcount tells us whether it existed.
+        result = db.session.execute(
+            db.delete(MenuItem).where(MenuItem.id == item_id)
+        )
 
-        if not menu_item:
-            return jsonify({'error': 'Menu item not found'}), 404
+        if result.rowcount == 0:
+            db.session.rollback()
+            return ojson({'error': 'Menu item not found'}, 404)
 
-        # Delete the menu item from the database.
-        db.session.delete(menu_item)
         db.session.commit()
 
-        return jsonify({'message': 'Menu item deleted successfully'}), 200
+        cache.clear()
+
+        return ojson({'message': 'Menu item deleted successfully'}, 200)
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 400
+        return ojson({"error": str(e)}, 400)
 
 
 # Define the data model for orders.
 class FoodOrder(db.Model):
+    # Composite index covering the combined status + customer filters.
+    __table_args__ = (
+        db.Index('ix_order_status_customer', 'order_status', 'customer_name'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
-    customer_name = db.Column(db.String(255), nullable=False)
-    # Store item IDs as a comma-separated string.
-    dish_ids = db.Column(db.String(255), nullable=False)
+    # Indexed so lookups by customer are B-tree seeks, not table scans.
+    customer_name = db.Column(db.String(255), nullable=False, index=True)
     total_price = db.Column(db.Integer, nullable=False)
-    order_status = db.Column(db.String(50), nullable=False, default='received')
+    order_status = db.Column(db.String(50), nullable=False, default='received',
+                             index=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow,
+                           onupdate=datetime.utcnow)
+    # Ordered dishes live in the order_item association table so they can
+    # be joined and eager-loaded instead of parsed out of a string.
+    items = db.relationship('OrderItem', lazy='selectin',
+                            back_populates='order')
     # Add any other relevant order details here.
 
 
-# Route to create a new order
-@app.route('/orders', methods=['POST'])
-def create_order():
-    # Get data from the request JSON
-    data = request.get_json()
+# Association table linking orders to the menu items they contain.
+class OrderItem(db.Model):
+    order_id = db.Column(db.Integer, db.ForeignKey('food_order.id'),
+                         primary_key=True)
+    menu_item_id = db.Column(db.Integer, db.ForeignKey('menu_item.id'),
+                             primary_key=True)
+    quantity = db.Column(db.Integer, default=1)
+    order = db.relationship('FoodOrder', back_populates='items')
+    menu_item = db.relationship('MenuItem')
+
+
+# Order list statement, precompiled the same way as menu_page_stmt; the
+# eager-load options ride along in the cached statement.
+def orders_stmt(customer_name=None, order_status=None):
+    stmt = lambda_stmt(lambda: select(FoodOrder).options(
+        selectinload(FoodOrder.items).selectinload(OrderItem.menu_item),
+        raiseload('*')))
+    if customer_name is not None:
+        stmt += lambda s: s.where(FoodOrder.customer_name == customer_name)
+    if order_status is not None:
+        stmt += lambda s: s.where(FoodOrder.order_status == order_status)
+    return stmt
 
-    # Convert the list of dish IDs to a string with comma separation
-    dish_ids_str = ','.join(data['dish_ids'])
 
-    # Extract customer name and item IDs from the JSON
-    customer_name = data['customer_name']
-    dish_ids = dish_ids_str,  # Store as a string
-    total_price = data['total_price'],
-    order_status = 'received'
-    # Check if customer name and item IDs are provided
-    if not customer_name or not dish_ids:
-        return jsonify({'error': 'Customer name and item IDs are required'}), 400
+# Request schema for order payloads, mirroring MenuItemIn: decoding
+# rejects missing fields and non-integer prices before any DB round trip.
+class OrderIn(msgspec.Struct):
+    customer_name: str
+    dish_ids: List[int]
+    total_price: int
 
-    # Create a new order with the received data
-    new_order = FoodOrder(customer_name=customer_name,
-                          dish_ids=dish_ids, total_price=total_price, order_status=order_status)
 
+# Route to create a new order
+@app.route('/orders', methods=['POST'])
+def create_order():
     try:
-        # Add the order to the database
-        db.session.add(new_order)
+        # Decode and validate the request body in one pass; malformed
+        # input returns a clean 400 instead of an unhandled error.
+        data = msgspec.json.decode(request.get_data(),
+                                   type=Union[OrderIn, List[OrderIn]])
+    except msgspec.DecodeError as e:
+        return ojson({'error': str(e)}, 400)
+
+    # Accept either a single order object or an array of orders; the array
+    # form creates all the orders in one transaction and one commit.
+    payloads = data if isinstance(data, list) else [data]
+
+    new_orders = []
+    for payload in payloads:
+        # Check if customer name and item IDs are provided
+        if not payload.customer_name or not payload.dish_ids:
+            return ojson({'error': 'Customer name and item IDs are required'}, 400)
+
+        # Create a new order with the received data
+        new_orders.append((FoodOrder(customer_name=payload.customer_name,
+                                     total_price=payload.total_price,
+                                     order_status='received'),
+                           payload.dish_ids))
+
+    try:
+        # Add the orders, flush to assign their IDs, then insert every
+        # order_item row for the whole batch in one multi-row INSERT.
+        db.session.add_all([order for order, _ in new_orders])
+        db.session.flush()
+        db.session.execute(
+            db.insert(OrderItem),
+            [{'order_id': order.id, 'menu_item_id': dish_id,
+              'quantity': quantity}
+             for order, dish_ids in new_orders
+             for dish_id, quantity in Counter(dish_ids).items()]
+        )
         db.session.commit()
-        return jsonify({'message': 'Order created successfully'}), 201
+        if isinstance(data, list):
+            return ojson({'message': f'{len(new_orders)} orders created successfully'}, 201)
+        return ojson({'message': 'Order created successfully'}, 201)
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 # Route to update order status by order ID
@@ -191,60 +472,93 @@ def update_order_status(order_id):
     data = request.get_json()
     new_status = data.get('order_status')
 
-    # Find the order by its ID
-    order = FoodOrder.query.get(order_id)
-
-    if not order:
-        return jsonify({'error': 'Order not found'}), 404
-
-    # Update the order status
-    order.order_status = new_status
-
     try:
+        # Update the single column with one Core UPDATE; the old
+        # get-then-mutate pattern cost an extra SELECT round trip.
+        result = db.session.execute(
+            db.update(FoodOrder)
+            .where(FoodOrder.id == order_id)
+            .values(order_status=new_status)
+        )
+
+        if result.rowcount == 0:
+            db.session.rollback()
+            return ojson({'error': 'Order not found'}, 404)
+
         db.session.commit()
-        return jsonify({'message': 'Order status updated successfully'}), 200
+        return ojson({'message': 'Order status updated successfully'}, 200)
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': 'Failed to update order status'}), 500
+        return ojson({'error': 'Failed to update order status'}, 500)
 
 
 # Route to retrieve orders by customer name
 @app.route('/orders/customer/<string:customer_name>', methods=['GET'])
+@cache.cached(timeout=5, response_filter=cacheable)
 def get_orders_by_customer(customer_name):
-    # Query orders by customer name
-    orders = FoodOrder.query.filter_by(customer_name=customer_name).all()
+    # The ETag covers the whole food_order table, so any order change
+    # invalidates it; unchanged polls still get a free 304.
+    etag = table_etag(FoodOrder)
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    # Query orders by customer name, eager-loading the order items (and
+    # their menu items) with one IN query each; raiseload turns any other
+    # accidental lazy load into an error instead of a silent N+1.
+    orders = db.session.execute(
+        orders_stmt(customer_name=customer_name)).scalars().all()
 
     if not orders:
-        return jsonify({'message': 'No orders found for this customer'}), 200
-
-    # Serialize the orders to JSON
-    orders_data = [{'id': order.id, 'customer_name': order.customer_name, 'order_status': order.order_status}
-                   for order in orders]
+        response = ojson({'message': 'No orders found for this customer'}, 200)
+    else:
+        # Serialize the orders to JSON
+        orders_data = [{'id': order.id, 'customer_name': order.customer_name, 'order_status': order.order_status}
+                       for order in orders]
+        response = ojson({'orders': orders_data}, 200)
 
-    return jsonify({'orders': orders_data}), 200
+    response.set_etag(etag, weak=True)
+    return response
 
 
 # Route to retrieve orders by order status
 @app.route('/orders/status/<string:order_status>', methods=['GET'])
+@cache.cached(timeout=5, response_filter=cacheable)
 def get_orders_by_status(order_status):
-    if order_status is not None:
-        # Query orders by order status
-        orders = FoodOrder.query.filter_by(order_status=order_status).all()
-    else:
-        # If order_status is not specified, retrieve all orders
-        orders = FoodOrder.query.all()
+    etag = table_etag(FoodOrder)
+    cached = not_modified(etag)
+    if cached:
+        return cached
 
-    if not orders:
-        return jsonify({'message': 'No orders found with this status'}), 200
+    # Eager-load order items up front; see get_orders_by_customer.
+    # orders_stmt leaves the status filter off when none was given.
+    orders = db.session.execute(
+        orders_stmt(order_status=order_status)).scalars().all()
 
-    # Serialize the orders to JSON
-    orders_data = [{'id': order.id, 'customer_name': order.customer_name, 'order_status': order.order_status}
-                   for order in orders]
+    if not orders:
+        response = ojson({'message': 'No orders found with this status'}, 200)
+    else:
+        # Serialize the orders to JSON
+        orders_data = [{'id': order.id, 'customer_name': order.customer_name, 'order_status': order.order_status}
+                       for order in orders]
+        response = ojson({'orders': orders_data}, 200)
 
-    return jsonify({'orders': orders_data}), 200
+    response.set_etag(etag, weak=True)
+    return response
 
 
-if __name__ == '__main__':
+# Create the tables only when explicitly asked (FLASK_INIT_DB=1);
+# unconditional create_all() cost reflection round trips on every worker
+# boot and raced when many gunicorn workers started at once. This must
+# stay below every model definition so create_all() sees all the tables.
+if config.init_db:
     with app.app_context():
         db.create_all()
-    app.run(debug=True)
+
+
+# Run under gunicorn in production (see gunicorn_conf.py); the Werkzeug
+# dev server below is single-process and only for local development.
+if __name__ == '__main__':
+    # The Werkzeug debugger traces every frame; never enable it outside
+    # development.
+    app.run(debug=config.flask_env == 'development')
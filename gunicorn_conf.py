@@ -0,0 +1,17 @@
+import multiprocessing
+
+# Threaded workers: the app is I/O bound on MySQL, so each worker serves
+# several requests concurrently while others wait on the database.
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = 'gthread'
+threads = 8
+
+bind = '0.0.0.0:8000'
+
+# Each worker builds its own SQLAlchemy engine and pool after fork. The
+# pool in app.py is sized to this thread count (8, no overflow), so total
+# MySQL connections stay at workers * threads; if you raise threads or
+# workers, re-check that product against the server's max_connections.
+# pool_pre_ping in app.py guards against any socket inherited across the
+# fork.
+preload_app = False